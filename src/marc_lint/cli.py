@@ -2,13 +2,18 @@
 
 import json
 import sys
+from contextlib import closing
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Iterator, Optional
 
-from pymarc import MARCReader
+from pymarc import MARCReader, Record
 
 from .linter import MarcLint, RecordResult
 
+# json.dumps builds a new encoder on every call made with options; the JSON
+# output reuses one configured encoder for every record instead.
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
 
 def main() -> None:
     """Main CLI entry point for marc-lint.
@@ -72,46 +77,87 @@ def main() -> None:
         print(f"Error: File '{filepath}' not found.", file=sys.stderr)
         sys.exit(2)
 
-    # Read and process records
-    try:
-        with open(filepath, "rb") as fh:
-            reader = MARCReader(fh)
-            records = list(reader)
-    except Exception as e:
-        print(f"Error reading file: {e}", file=sys.stderr)
-        sys.exit(2)
-
-    if not records:
+    # Read, lint and report one record at a time
+    linter = MarcLint()
+    record_count = 0
+    total_warnings = 0
+    records_with_warnings = 0
+    records = _read_file(filepath)
+    with closing(records):
+        # Output only needs IDs and warnings, so let each Record go
+        results = linter.iter_check_records(
+            records, use_index_as_id=use_index, retain_record=False
+        )
+        try:
+            for result in results:
+                if output_format == "json":
+                    _output_json_result(result, first=record_count == 0)
+                else:
+                    _output_text_result(result)
+                record_count += 1
+                if result.warnings:
+                    total_warnings += len(result.warnings)
+                    records_with_warnings += 1
+        except _ReadError as e:
+            if output_format == "json" and record_count:
+                # Keep stdout a complete JSON array of the records written
+                print("\n]")
+            print(f"Error reading file: {e}", file=sys.stderr)
+            sys.exit(2)
+
+    if not record_count:
         if output_format == "json":
             print("[]")
         elif not quiet:
             print("No records found in file.")
         sys.exit(0)
 
-    # Lint all records
-    linter = MarcLint()
-    results = linter.check_records(records, use_index_as_id=use_index)
-
-    total_warnings = sum(len(r.warnings) for r in results)
-    records_with_warnings = sum(1 for r in results if not r.is_valid)
-
     # Output results
     if output_format == "json":
-        _output_json(results)
-    else:
-        _output_text(results)
-        if not quiet:
-            print("=" * 60)
-            print(f"Processed {len(results)} record(s)")
-            print(
-                f"Found {total_warnings} warning(s) in {records_with_warnings} record(s)"
-            )
-            if total_warnings == 0:
-                print("\n✓ No validation warnings found!")
+        print("\n]")
+    elif not quiet:
+        print("=" * 60)
+        print(f"Processed {record_count} record(s)")
+        print(f"Found {total_warnings} warning(s) in {records_with_warnings} record(s)")
+        if total_warnings == 0:
+            print("\n✓ No validation warnings found!")
 
     sys.exit(1 if total_warnings > 0 else 0)
 
 
+class _ReadError(Exception):
+    """A failure while reading records from the input file."""
+
+
+def _read_file(filepath: Path) -> Iterator[Optional[Record]]:
+    """Yield the records in `filepath`, raising `_ReadError` if it can't be read."""
+    try:
+        with open(filepath, "rb") as fh:
+            yield from _read_records(fh)
+    except OSError as e:
+        raise _ReadError(e) from e
+
+
+def _read_records(fh: BinaryIO) -> Iterator[Optional[Record]]:
+    """Yield records from `fh`, raising `_ReadError` if reading fails.
+
+    Only the reader is guarded, so errors raised while linting or writing
+    output are not mistaken for a bad input file.
+    """
+    try:
+        records = iter(MARCReader(fh))
+    except Exception as e:
+        raise _ReadError(e) from e
+    while True:
+        try:
+            record = next(records)
+        except StopIteration:
+            return
+        except Exception as e:
+            raise _ReadError(e) from e
+        yield record
+
+
 def _print_usage() -> None:
     """Print usage information."""
     print("Usage: marc-lint [OPTIONS] <file.mrc>")
@@ -127,36 +173,34 @@ def _print_usage() -> None:
     print("  2  Error reading file")
 
 
-def _output_text(results: List[RecordResult]) -> None:
-    """Output results in text format."""
-    for result in results:
-        if result.warnings:
-            print(f"\n--- Record {result.record_id} ---")
-            for warning in result.warnings:
-                # Format: field (position if applicable): message
-                field_str = warning.field
-                if warning.position is not None:
-                    field_str = f"{field_str} (occurrence {warning.position + 1})"
-                if warning.subfield:
-                    print(
-                        f"  {field_str}: Subfield {warning.subfield} {warning.message}"
-                    )
-                else:
-                    print(f"  {field_str}: {warning.message}")
+def _output_text_result(result: RecordResult) -> None:
+    """Output one record's results in text format."""
+    if result.warnings:
+        print(f"\n--- Record {result.record_id} ---")
+        for warning in result.warnings:
+            # Format: field (position if applicable): message
+            field_str = warning.field
+            if warning.position is not None:
+                field_str = f"{field_str} (occurrence {warning.position + 1})"
+            if warning.subfield:
+                print(f"  {field_str}: Subfield {warning.subfield} {warning.message}")
+            else:
+                print(f"  {field_str}: {warning.message}")
 
 
-def _output_json(results: List[RecordResult]) -> None:
-    """Output results in JSON format."""
-    output = []
-    for result in results:
-        record_data = {
-            "record_id": result.record_id,
-            "is_valid": result.is_valid,
-            "warnings": [w.to_dict() for w in result.warnings],
-        }
-        output.append(record_data)
+def _output_json_result(result: RecordResult, first: bool) -> None:
+    """Output one record's results as an element of a streamed JSON array.
 
-    print(json.dumps(output, indent=2))
+    The elements are written exactly as `json.dumps(results, indent=2)` would
+    lay them out, so the complete output is one indented JSON array.
+    """
+    record_data = {
+        "record_id": result.record_id,
+        "is_valid": result.is_valid,
+        "warnings": [w.to_dict() for w in result.warnings],
+    }
+    element = _JSON_ENCODER.encode(record_data).replace("\n", "\n  ")
+    print("[\n  " if first else ",\n  ", element, sep="", end="")
 
 
 if __name__ == "__main__":
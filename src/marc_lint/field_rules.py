@@ -98,7 +98,12 @@ class RuleGenerator:
                     char_class = "".join(safe_chars)
                     regex = rf"^[{char_class}]$"
 
-                ind_rules[key] = {"value": val, "description": desc, "regex": regex}
+                # Compiled here so linters never recompile per indicator check
+                ind_rules[key] = {
+                    "value": val,
+                    "description": desc,
+                    "regex": re.compile(regex),
+                }
             else:
                 rules["subfields"][key] = {
                     "repeatable": True if val == "R" else False,
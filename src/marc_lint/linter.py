@@ -16,8 +16,25 @@ Python port:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Callable, Optional
+from collections import OrderedDict
+from functools import cache, lru_cache
+from multiprocessing import Pool
+from multiprocessing.pool import Pool as PoolType
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Callable,
+    Mapping,
+    Optional,
+    Tuple,
+)
+import pickle
 import re
+import sys
 
 from pymarc import Record, Field
 from stdnum import isbn as stdnum_isbn
@@ -47,6 +64,173 @@ from .code_data import (
 )
 from .warning import MarcWarning
 
+# 020 (ISBN) patterns, compiled once rather than looked up on every subfield
+_ISBN_EXTRACT_RE = re.compile(r"\D*(\d{9,12}[X\d])\b")
+_ISBN_QUALIFIER_SPACING_RE = re.compile(r"[X0-9] \(")
+_ISBN_LENGTH_RE = re.compile(r"^(?:\d{10}|\d{13}|\d{9}X)$")
+_ISBN_HYPHENATED_RE = re.compile(r"^\d*-\d+")
+
+# 022 (ISSN) patterns
+_ISSN_EXTRACT_RE = re.compile(r"(\d{4}-?\d{3}[X\d])\b", re.I)
+_ISSN_AT_START_RE = re.compile(r"^\d{4}-?\d{3}[X\d]", re.I)
+_ISSN_HYPHENATED_RE = re.compile(r"^\d{4}-\d{3}[\dXx]", re.I)
+_ISSN_LENGTH_RE = re.compile(r"^\d{7}[X\d]$", re.I)
+
+# 245 punctuation patterns
+_245_FINAL_RE = re.compile(r"[.?!]$")
+_245_FINAL_QE_RE = re.compile(r"[?!]$")  # question or exclamation mark
+_245_BEFORE_C_RE = re.compile(r"\s/$")
+_245_SPACED_INITIALS_RE = re.compile(r"\b\w\. \b\w\.")
+_245_IE_INITIALS_RE = re.compile(r"\[\bi\.e\. \b\w\..*\]")
+_245_BEFORE_B_RE = re.compile(r" [:;=]$")
+_245_BEFORE_H_RE = re.compile(r"(\S$)|(\-\- $)")
+_245_H_BRACKETS_RE = re.compile(r"^\[\w*\s*\w*\]")
+_245_PERIOD_BEFORE_RE = re.compile(r"(\S\.$)|(\-\- \.$)")
+_245_COMMA_BEFORE_RE = re.compile(r"(\S,$)|(\-\- ,$)")
+
+# Non-filing indicator and article patterns
+_NONFILING_INDICATOR_RE = re.compile(r"^[0-9]$")
+_TITLE_FIRST_WORD_RE = re.compile(r"^([^ \(\)\[\]'\"\-]+)([ \(\)\[\]'\"])?(.*)", re.I)
+# One case-insensitive alternation replaces a re.match per exception phrase
+_ARTICLE_EXCEPTION_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(ARTICLE_EXCEPTIONS, key=len, reverse=True)),
+    re.I,
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Wrap nested dicts in read-only mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+@cache
+def _field_rules() -> Mapping[str, Mapping[str, Any]]:
+    """Parse the field rule table once per process.
+
+    Every linter shares the result, so it is returned read-only.
+    """
+    return _freeze(RuleGenerator().rules)
+
+
+@lru_cache(maxsize=4096)
+def _isbn_is_valid(number: str) -> bool:
+    """Memoized python-stdnum ISBN check; batches often repeat the same ISBN."""
+    return stdnum_isbn.is_valid(number)
+
+
+@lru_cache(maxsize=4096)
+def _issn_is_valid(number: str) -> bool:
+    """Memoized python-stdnum ISSN check; serial batches repeat the same ISSN."""
+    return stdnum_issn.is_valid(number)
+
+
+# 008/38 (modified record) and 008/39 (cataloging source) values
+_008_MODIFIED_RECORD = {" ", "d", "o", "r", "s", "x", "|"}
+_008_CATALOGING_SOURCE = {" ", "c", "d", "u", "|"}
+
+
+def _char_class(chars: Any) -> str:
+    """Build a regex character class matching any of `chars`."""
+    return "[" + "".join(re.escape(c) for c in sorted(chars)) + "]"
+
+
+# Fast path for well-formed 008s: one anchored match covers the fixed
+# character-class positions (06, 07-10, 11-14, 38, 39) and captures the
+# code-list positions, which are then checked with two set lookups. Any
+# miss falls back to the per-position diagnostics in `check_008`.
+_008_DATE = r"(?:[0-9u]{4}|    |\|{4})"
+_008_FAST_PATH_RE = re.compile(
+    r".{6}"
+    + _char_class(TYPE_OF_DATE)
+    + _008_DATE
+    + _008_DATE
+    + r"(?P<country>.{3}).{17}(?P<language>.{3})"
+    + _char_class(_008_MODIFIED_RECORD)
+    + _char_class(_008_CATALOGING_SOURCE),
+    re.DOTALL,
+)
+_008_FAST_PATH_COUNTRIES = {code.ljust(3) for code in COUNTRY_CODES} | {"   ", "|||"}
+_008_FAST_PATH_LANGUAGES = set(LANGUAGE_CODES) | {"|||"}
+
+
+def _fields_by_tag(marc: Record) -> Dict[str, List[Field]]:
+    """Group a record's fields by tag in one pass, keeping field order."""
+    by_tag: Dict[str, List[Field]] = {}
+    for field in marc.fields:
+        by_tag.setdefault(field.tag, []).append(field)
+    return by_tag
+
+
+def _control_number(fields_by_tag: Dict[str, List[Field]]) -> Optional[str]:
+    """Return the data of the first 001, or None if there is no usable 001."""
+    field_001 = fields_by_tag.get("001")
+    if field_001 and hasattr(field_001[0], "data"):
+        return field_001[0].data
+    return None
+
+
+def _record_key(marc: Record) -> Tuple[Any, ...]:
+    """Hashable snapshot of a record's leader and field content."""
+    return (
+        str(marc.leader),
+        tuple(
+            (field.tag, field.data)
+            if field.is_control_field()
+            else (field.tag, tuple(field.indicators), tuple(field.subfields))
+            for field in marc.fields
+        ),
+    )
+
+
+def _copy_warnings(warnings: Iterable[MarcWarning]) -> List[MarcWarning]:
+    """Copy warnings so a cached list never shares objects with a caller."""
+    return [
+        MarcWarning(w.field, w.message, w.subfield, w.position, w.record_id)
+        for w in warnings
+    ]
+
+
+# Marks the current record's 008 language as not yet looked up
+_NOT_READ = object()
+
+
+class _FirstWarning(BaseException):
+    """Raised by `MarcLint.warn` to abandon a record in fail-fast mode.
+
+    A BaseException so that an `except Exception` in a checker cannot
+    swallow it and keep checking the record.
+    """
+
+
+def _intern(value: Any) -> Any:
+    """Intern exact `str` values; sys.intern rejects str subclasses."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Batches smaller than this are checked in-process even when `processes > 1`;
+# below it, starting workers and pickling records costs more than it saves.
+_PARALLEL_MIN_RECORDS = 256
+
+
+def _check_chunk(
+    args: Tuple[bytes, int, List[Record], bool, bool],
+) -> Tuple[int, List[Tuple[str, List[MarcWarning]]]]:
+    """Worker for `MarcLint.check_records`: lint one contiguous slice of a batch.
+
+    `args` carries the calling linter pickled, so each worker checks with a
+    copy configured exactly like it. Returns the slice's start index with a
+    (record_id, warnings) pair per record; the parent attaches its own Record
+    objects to the results.
+    """
+    linter_state, start, records, use_index_as_id, fail_fast = args
+    linter = pickle.loads(linter_state)
+    return start, [
+        linter._check_batch_record(idx, record, use_index_as_id, fail_fast)
+        for idx, record in enumerate(records, start)
+    ]
+
 
 class RecordResult:
     """Result of linting a single MARC record.
@@ -57,6 +241,8 @@ class RecordResult:
         record: Reference to the original Record object
     """
 
+    __slots__ = ("record_id", "warnings", "record")
+
     def __init__(
         self,
         record_id: str,
@@ -86,15 +272,69 @@ class MarcLint:
     use `check_records(records)` to validate multiple records at once.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_size: int = 0) -> None:
+        """Create a linter.
+
+        Args:
+            cache_size: If greater than 0, remember the warnings for up to this
+                        many distinct records (least recently used are
+                        evicted), so duplicate records in a batch are only
+                        checked once. Only enable this for linters whose
+                        checks depend on nothing but the record itself.
+        """
         self._warnings: list[MarcWarning] = []
-        self._rules = RuleGenerator().rules
+        self._rules = _field_rules()
         self._current_record_id: Optional[str] = None
         self._current_record: Optional[Record] = None
+        self._current_fields_by_tag: Dict[str, List[Field]] = {}
+        self._current_language: Optional[str] | object = _NOT_READ
+        self._fail_fast = False
+        self._cache_size = cache_size
+        self._cache: OrderedDict[Tuple[Any, ...], Tuple[MarcWarning, ...]] = (
+            OrderedDict()
+        )
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._field_positions: Dict[
             str, int
         ] = {}  # Track positions of repeating fields
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the linter's configuration without its per-record state."""
+        state = self.__dict__.copy()
+        for name in (
+            "_warnings",
+            "_current_record_id",
+            "_current_record",
+            "_current_fields_by_tag",
+            "_current_language",
+            "_fail_fast",
+            "_cache",
+            "_cache_hits",
+            "_cache_misses",
+            "_field_positions",
+        ):
+            state.pop(name, None)
+        if state.get("_rules") is _field_rules():
+            # The shared rule table is rebuilt on unpickling
+            del state["_rules"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._warnings = []
+        self._current_record_id = None
+        self._current_record = None
+        self._current_fields_by_tag = {}
+        self._current_language = _NOT_READ
+        self._fail_fast = False
+        self._cache = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._field_positions = {}
+        if "_rules" not in state:
+            self._rules = _field_rules()
+
     # -------- warning handling --------
 
     def warnings(self) -> List[str]:
@@ -113,6 +353,8 @@ class MarcLint:
         self._warnings = []
         self._field_positions = {}
         self._current_record = None
+        self._current_fields_by_tag = {}
+        self._current_language = _NOT_READ
 
     def warn(
         self,
@@ -133,20 +375,24 @@ class MarcLint:
         """
         # Use provided record_id or fall back to current record context
         rid = record_id if record_id is not None else self._current_record_id
+        # Tags and codes often come from the record being checked; interning
+        # them lets warnings that outlive the record share one string each.
         self._warnings.append(
             MarcWarning(
-                field=field,
+                field=_intern(field),
                 message=message,
-                subfield=subfield,
+                subfield=_intern(subfield),
                 position=position,
                 record_id=rid,
             )
         )
+        if self._fail_fast:
+            raise _FirstWarning
 
     # -------- main record check --------
 
     def check_record(
-        self, marc: Record, record_id: Optional[str] = None
+        self, marc: Record, record_id: Optional[str] = None, fail_fast: bool = False
     ) -> List[MarcWarning]:
         """Run lint checks on a `pymarc.Record`.
 
@@ -159,43 +405,113 @@ class MarcLint:
             marc: A pymarc.Record object to validate
             record_id: Optional identifier for the record. If not provided,
                        will attempt to use the 001 field value.
+            fail_fast: If True, stop checking at the first warning, so the
+                       result holds at most one warning.
 
         Returns:
             List of MarcWarning objects for this record.
         """
+        fields_by_tag = _fields_by_tag(marc) if isinstance(marc, Record) else None
+        return self._run_checks(marc, fields_by_tag, record_id, fail_fast)
+
+    def is_valid_record(self, marc: Record) -> bool:
+        """Return True if `marc` produces no warnings.
+
+        Stops at the first defect instead of collecting every warning,
+        which makes it the cheaper call for screening batches.
+        """
+        return not self.check_record(marc, fail_fast=True)
 
+    def _run_checks(
+        self,
+        marc: Record,
+        fields_by_tag: Optional[Dict[str, List[Field]]],
+        record_id: Optional[str],
+        fail_fast: bool,
+    ) -> List[MarcWarning]:
+        """Reset state and check `marc`; `fields_by_tag` is None for non-Records."""
         self.clear_warnings()
+        if self._cache_size > 0 and fields_by_tag is not None and not fail_fast:
+            return self._run_cached_checks(marc, fields_by_tag, record_id)
+        self._fail_fast = fail_fast
+        try:
+            if fields_by_tag is None:
+                self.warn("", "Must pass a MARC::Record-like object to check_record")
+            else:
+                self._check_indexed_record(marc, fields_by_tag, record_id)
+        except _FirstWarning:
+            # Checking stopped part-way through; drop the record context
+            self._reset_record_context()
+        finally:
+            self._fail_fast = False
+        return self._warnings
 
-        if not isinstance(marc, Record):
-            self.warn("", "Must pass a MARC::Record-like object to check_record")
+    def _run_cached_checks(
+        self,
+        marc: Record,
+        fields_by_tag: Dict[str, List[Field]],
+        record_id: Optional[str],
+    ) -> List[MarcWarning]:
+        """`_run_checks` through the duplicate-record cache."""
+        key = (record_id, _record_key(marc))
+        try:
+            cached = self._cache.get(key)
+        except TypeError:  # unhashable field content; check without caching
+            return self._check_indexed_record(marc, fields_by_tag, record_id)
+
+        if cached is not None:
+            self._cache_hits += 1
+            self._cache.move_to_end(key)
+            # Hand out copies; callers may edit the warnings they get back
+            self._warnings = _copy_warnings(cached)
             return self._warnings
 
+        self._cache_misses += 1
+        warnings = self._check_indexed_record(marc, fields_by_tag, record_id)
+        self._cache[key] = tuple(_copy_warnings(warnings))
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return warnings
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return hit/miss counts and occupancy of the duplicate-record cache."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._cache),
+            "maxsize": self._cache_size,
+        }
+
+    def _check_indexed_record(
+        self,
+        marc: Record,
+        fields_by_tag: Dict[str, List[Field]],
+        record_id: Optional[str] = None,
+    ) -> List[MarcWarning]:
+        """Body of `check_record` for a Record whose fields are already indexed."""
+
         # Set current record ID for context
         if record_id:
             self._current_record_id = record_id
         else:
             # Try to get record ID from 001 field
-            field_001 = marc.get_fields("001")
-            if field_001 and hasattr(field_001[0], "data"):
-                self._current_record_id = field_001[0].data
-            else:
-                self._current_record_id = None
+            self._current_record_id = _control_number(fields_by_tag)
 
         # Store current record for use by field checkers
         self._current_record = marc
+        self._current_fields_by_tag = fields_by_tag
 
         # Check leader first
         self.check_leader(marc)
 
-        one_xx = [f for f in marc.get_fields() if f.tag.startswith("1")]
-        if len(one_xx) > 1:
+        one_xx = sum(len(f) for tag, f in fields_by_tag.items() if tag[:1] == "1")
+        if one_xx > 1:
             self.warn(
                 "1XX",
-                f"Only one 1XX tag is allowed, but I found {len(one_xx)} of them.",
+                f"Only one 1XX tag is allowed, but I found {one_xx} of them.",
             )
         # Check for presence of 245
-        field_tags = {f.tag for f in marc.fields}
-        missing = REQUIRED_FIELDS - field_tags
+        missing = REQUIRED_FIELDS - fields_by_tag.keys()
         if missing:
             for tag in sorted(missing):
                 self.warn(tag, f"No {tag} tag.")
@@ -205,7 +521,7 @@ class MarcLint:
         for field in marc.get_fields():
             tagno = field.tag
 
-            tagrules: dict[str, Any] | None = None
+            tagrules: Mapping[str, Any] | None = None
 
             # Track field position for this tag
             key = f"880.{tagno}" if tagno == "880" else tagno
@@ -261,49 +577,160 @@ class MarcLint:
 
             field_seen[key] = position + 1
 
-        # Reset current record context
-        self._current_record_id = None
-        self._current_record = None
+        self._reset_record_context()
 
         return self._warnings
 
+    def _reset_record_context(self) -> None:
+        """Forget the record that `_check_indexed_record` was working on."""
+        self._current_record_id = None
+        self._current_record = None
+        self._current_fields_by_tag = {}
+        self._current_language = _NOT_READ
+
     def check_records(
-        self, records: List[Record], use_index_as_id: bool = False
+        self,
+        records: Iterable[Record],
+        use_index_as_id: bool = False,
+        processes: int = 1,
+        fail_fast: bool = False,
+        retain_record: bool = True,
+        pool: Optional[PoolType] = None,
     ) -> List[RecordResult]:
         """Run lint checks on multiple MARC records.
 
         Args:
-            records: List of pymarc.Record objects to validate
+            records: Iterable of pymarc.Record objects to validate
             use_index_as_id: If True, use the 0-based index as record_id when
                             001 field is not available. If False, record_id
                             may be None for records without 001.
+            processes: Number of worker processes to shard the batch across.
+                       Batches of fewer than 256 records are always checked
+                       in the calling process. Each worker checks with a
+                       pickled copy of this linter, so the linter (including
+                       any subclass state) must be picklable. On platforms
+                       that spawn workers (macOS, Windows) the calling script
+                       needs an `if __name__ == "__main__":` guard.
+            fail_fast: If True, stop checking each record at its first
+                       warning. `is_valid` is still exact, but each result
+                       holds at most one warning.
+            retain_record: If False, results do not keep a reference to their
+                           Record (`record` is None), so records can be freed
+                           once checked.
+            pool: An existing `multiprocessing.Pool` to run the workers on,
+                  instead of starting a new one for this call. `processes`
+                  still sets how many slices the batch is split into.
 
         Returns:
             List of RecordResult objects, one for each input record.
         """
-        results: List[RecordResult] = []
+        if processes <= 1:
+            return list(
+                self.iter_check_records(
+                    records, use_index_as_id, fail_fast, retain_record
+                )
+            )
+
+        records = list(records)
+        if len(records) >= _PARALLEL_MIN_RECORDS:
+            checked = self._check_records_parallel(
+                records, use_index_as_id, processes, fail_fast, pool
+            )
+        else:
+            checked = [
+                self._check_batch_record(idx, record, use_index_as_id, fail_fast)
+                for idx, record in enumerate(records)
+            ]
+
+        return [
+            RecordResult(record_id, warnings, record if retain_record else None)
+            for (record_id, warnings), record in zip(checked, records)
+        ]
 
+    def iter_check_records(
+        self,
+        records: Iterable[Record],
+        use_index_as_id: bool = False,
+        fail_fast: bool = False,
+        retain_record: bool = True,
+    ) -> Iterator[RecordResult]:
+        """Lazily run lint checks on a stream of MARC records.
+
+        Like `check_records`, but yields each RecordResult as soon as its
+        record is checked, so records can be read straight from a
+        `MARCReader` without holding the whole file in memory.
+
+        Args:
+            records: Iterable of pymarc.Record objects to validate
+            use_index_as_id: If True, use the 0-based index as record_id when
+                            001 field is not available.
+            fail_fast: If True, stop checking each record at its first warning.
+            retain_record: If False, results do not keep a reference to their
+                           Record, so a streamed record can be freed as soon
+                           as its result has been consumed.
+
+        Yields:
+            One RecordResult per input record, in input order.
+        """
         for idx, record in enumerate(records):
-            # Determine record ID
-            record_id: Optional[str] = None
-            field_001 = record.get_fields("001") if isinstance(record, Record) else []
-            if field_001 and hasattr(field_001[0], "data"):
-                record_id = field_001[0].data
-            elif use_index_as_id:
-                record_id = str(idx)
-
-            # Check the record
-            warnings = self.check_record(record, record_id=record_id)
-
-            # Create result object
-            result = RecordResult(
-                record_id=record_id or str(idx),
-                warnings=list(warnings),  # Copy the list
-                record=record,
+            record_id, warnings = self._check_batch_record(
+                idx, record, use_index_as_id, fail_fast
             )
-            results.append(result)
+            yield RecordResult(record_id, warnings, record if retain_record else None)
+
+    def _check_batch_record(
+        self, idx: int, record: Record, use_index_as_id: bool, fail_fast: bool = False
+    ) -> Tuple[str, List[MarcWarning]]:
+        """Check one record of a batch; return its result ID and warnings."""
+        if not isinstance(record, Record):
+            record_id = str(idx) if use_index_as_id else None
+            warnings = self._run_checks(record, None, record_id, fail_fast)
+            return record_id or str(idx), list(warnings)
+
+        # Index the fields once; the record ID and the checks share it
+        fields_by_tag = _fields_by_tag(record)
+        field_001 = fields_by_tag.get("001")
+        if field_001 and hasattr(field_001[0], "data"):
+            record_id = field_001[0].data
+        elif use_index_as_id:
+            record_id = str(idx)
+        else:
+            record_id = None
+
+        # Check the record
+        warnings = self._run_checks(record, fields_by_tag, record_id, fail_fast)
+
+        return record_id or str(idx), list(warnings)  # Copy the list
 
-        return results
+    def _check_records_parallel(
+        self,
+        records: List[Record],
+        use_index_as_id: bool,
+        processes: int,
+        fail_fast: bool = False,
+        pool: Optional[PoolType] = None,
+    ) -> List[Tuple[str, List[MarcWarning]]]:
+        """Shard `records` into one contiguous slice per worker and merge."""
+        # Pickle up front so an unpicklable linter fails here, not in a worker
+        linter_state = pickle.dumps(self)
+        size = -(-len(records) // processes)
+        chunks = [
+            (
+                linter_state,
+                start,
+                records[start : start + size],
+                use_index_as_id,
+                fail_fast,
+            )
+            for start in range(0, len(records), size)
+        ]
+        if pool is None:
+            with Pool(processes) as own_pool:
+                done = list(own_pool.imap_unordered(_check_chunk, chunks, chunksize=1))
+        else:
+            done = list(pool.imap_unordered(_check_chunk, chunks, chunksize=1))
+        done.sort(key=lambda item: item[0])
+        return [checked for _, chunk in done for checked in chunk]
 
     # # -------- General checks --------
 
@@ -388,7 +815,7 @@ class MarcLint:
             )
 
     def check_indicators(
-        self, tagno: str, field: Field, tagrules: dict[str, Any], position: int = 0
+        self, tagno: str, field: Field, tagrules: Mapping[str, Any], position: int = 0
     ) -> None:
         """General indicator checks for any field."""
         # indicator checks (pymarc exposes them via `indicators` list)
@@ -413,7 +840,7 @@ class MarcLint:
                 )
 
     def check_subfields(
-        self, tagno: str, field: Field, tagrules: dict[str, Any], position: int = 0
+        self, tagno: str, field: Field, tagrules: Mapping[str, Any], position: int = 0
     ) -> None:
         """General subfield checks for any field."""
         subpairs = self._get_subfield_pairs(field)
@@ -460,7 +887,7 @@ class MarcLint:
         for code, data in subpairs:
             # Extract ISBN number (remove hyphens and extract digits/X)
             isbnno = data.replace("-", "")
-            m = re.search(r"\D*(\d{9,12}[X\d])\b", isbnno)
+            m = _ISBN_EXTRACT_RE.search(isbnno)
             isbnno = m.group(1) if m else ""
 
             if code == "a":
@@ -472,7 +899,7 @@ class MarcLint:
                         position=pos,
                     )
 
-                if "(" in data and not re.search(r"[X0-9] \(", data):
+                if "(" in data and not _ISBN_QUALIFIER_SPACING_RE.search(data):
                     self.warn(
                         "020",
                         f"qualifier must be preceded by space, {data}.",
@@ -480,7 +907,7 @@ class MarcLint:
                         position=pos,
                     )
 
-                if not re.match(r"^(?:\d{10}|\d{13}|\d{9}X)$", isbnno):
+                if not _ISBN_LENGTH_RE.match(isbnno):
                     self.warn(
                         "020",
                         f"has the wrong number of digits, {data}.",
@@ -489,7 +916,7 @@ class MarcLint:
                     )
                 else:
                     # Use python-stdnum for validation
-                    if not stdnum_isbn.is_valid(isbnno):
+                    if not _isbn_is_valid(isbnno):
                         if len(isbnno) == 10:
                             self.warn(
                                 "020",
@@ -506,8 +933,8 @@ class MarcLint:
                             )
 
             elif code == "z":
-                if data.startswith("ISBN") or re.match(r"^\d*-\d+", data):
-                    if len(isbnno) == 10 and stdnum_isbn.is_valid(isbnno):
+                if data.startswith("ISBN") or _ISBN_HYPHENATED_RE.match(data):
+                    if len(isbnno) == 10 and _isbn_is_valid(isbnno):
                         self.warn(
                             "020", "is numerically valid.", subfield="z", position=pos
                         )
@@ -527,7 +954,7 @@ class MarcLint:
         for code, data in subpairs:
             # Extract ISSN number (remove hyphens and find 8-digit sequence)
             # ISSN format: 8 characters (7 digits + check digit which can be X)
-            m = re.search(r"(\d{4}-?\d{3}[X\d])\b", data, re.I)
+            m = _ISSN_EXTRACT_RE.search(data)
             if m:
                 issnno = m.group(1).replace("-", "").upper()
             else:
@@ -535,7 +962,7 @@ class MarcLint:
 
             if code == "a":
                 # Check if ISSN appears to be at start of subfield
-                if issnno and not re.match(r"^\d{4}-?\d{3}[X\d]", data, re.I):
+                if issnno and not _ISSN_AT_START_RE.match(data):
                     self.warn(
                         "022",
                         "may have invalid characters.",
@@ -546,7 +973,7 @@ class MarcLint:
                 # Check for proper hyphen format if hyphen is present
                 if "-" in data and issnno:
                     # Should be XXXX-XXXX format
-                    if not re.match(r"^\d{4}-\d{3}[\dXx]", data, re.I):
+                    if not _ISSN_HYPHENATED_RE.match(data):
                         self.warn(
                             "022",
                             f"has improper hyphen placement, {data}.",
@@ -555,7 +982,7 @@ class MarcLint:
                         )
 
                 # Check length
-                if not re.match(r"^\d{7}[X\d]$", issnno, re.I):
+                if not _ISSN_LENGTH_RE.match(issnno):
                     self.warn(
                         "022",
                         f"has the wrong number of digits, {data}.",
@@ -564,7 +991,7 @@ class MarcLint:
                     )
                 else:
                     # Use python-stdnum for validation
-                    if not stdnum_issn.is_valid(issnno):
+                    if not _issn_is_valid(issnno):
                         self.warn(
                             "022",
                             f"has bad checksum, {data}.",
@@ -574,7 +1001,7 @@ class MarcLint:
 
             elif code == "y":
                 # Incorrect ISSN - warn if it's actually valid
-                if issnno and stdnum_issn.is_valid(issnno):
+                if issnno and _issn_is_valid(issnno):
                     self.warn(
                         "022", "is numerically valid.", subfield="y", position=pos
                     )
@@ -588,7 +1015,7 @@ class MarcLint:
                         subfield="z",
                         position=pos,
                     )
-                elif not re.match(r"^\d{7}[X\d]$", issnno, re.I):
+                elif not _ISSN_LENGTH_RE.match(issnno):
                     self.warn(
                         "022",
                         f"has invalid format, {data}.",
@@ -627,10 +1054,8 @@ class MarcLint:
                     value[pos : pos + 3] for pos in range(0, len(value), 3)
                 ]
                 for c in codes041:
-                    valid = 1 if LANGUAGE_CODES.get(c) else 0
-                    obsolete = 1 if OBSOLETE_LANGUAGE_CODES.get(c) else 0
-                    if not valid:
-                        if obsolete:
+                    if c not in LANGUAGE_CODES:
+                        if c in OBSOLETE_LANGUAGE_CODES:
                             self.warn(
                                 "041",
                                 f"{value}, may be obsolete.",
@@ -662,10 +1087,8 @@ class MarcLint:
                     position=pos,
                 )
             else:
-                valid = 1 if GEOG_AREA_CODES.get(value) else 0
-                obsolete = 1 if OBSOLETE_GEOG_AREA_CODES.get(value) else 0
-                if not valid:
-                    if obsolete:
+                if value not in GEOG_AREA_CODES:
+                    if value in OBSOLETE_GEOG_AREA_CODES:
                         self.warn(
                             "043",
                             f"{value}, may be obsolete.",
@@ -695,6 +1118,14 @@ class MarcLint:
         # Get field data (control fields store data directly, not in subfields)
         data = getattr(field, "data", "") or ""
 
+        m = _008_FAST_PATH_RE.fullmatch(data)
+        if (
+            m
+            and m.group("country") in _008_FAST_PATH_COUNTRIES
+            and m.group("language") in _008_FAST_PATH_LANGUAGES
+        ):
+            return
+
         # Check length
         if len(data) != 40:
             self.warn(
@@ -736,15 +1167,10 @@ class MarcLint:
         # Positions 15-17: Place of publication (country code)
         # Country codes can be 2 or 3 characters, right-padded with space
         country = data[15:18]
+        # Code table keys are stored stripped, so one membership test suffices
         country_stripped = country.strip()
-        valid_country = COUNTRY_CODES.get(country) or COUNTRY_CODES.get(
-            country_stripped
-        )
-        obsolete_country = OBSOLETE_COUNTRY_CODES.get(
-            country
-        ) or OBSOLETE_COUNTRY_CODES.get(country_stripped)
-        if not valid_country and country_stripped != "":
-            if obsolete_country:
+        if country_stripped not in COUNTRY_CODES and country_stripped != "":
+            if country_stripped in OBSOLETE_COUNTRY_CODES:
                 self.warn(
                     "008",
                     f"Country code '{country}' at positions 15-17 may be obsolete.",
@@ -759,10 +1185,8 @@ class MarcLint:
 
         # Positions 35-37: Language code
         language = data[35:38]
-        valid_lang = LANGUAGE_CODES.get(language)
-        obsolete_lang = OBSOLETE_LANGUAGE_CODES.get(language)
-        if not valid_lang:
-            if obsolete_lang:
+        if language not in LANGUAGE_CODES:
+            if language in OBSOLETE_LANGUAGE_CODES:
                 self.warn(
                     "008",
                     f"Language code '{language}' at positions 35-37 may be obsolete.",
@@ -779,8 +1203,7 @@ class MarcLint:
 
         # Position 38: Modified record
         modified_record = data[38]
-        valid_modified = {" ", "d", "o", "r", "s", "x", "|"}
-        if modified_record not in valid_modified:
+        if modified_record not in _008_MODIFIED_RECORD:
             self.warn(
                 "008",
                 f"Invalid modified record indicator '{modified_record}' at position 38.",
@@ -789,8 +1212,7 @@ class MarcLint:
 
         # Position 39: Cataloging source
         cataloging_source = data[39]
-        valid_cataloging = {" ", "c", "d", "u", "|"}
-        if cataloging_source not in valid_cataloging:
+        if cataloging_source not in _008_CATALOGING_SOURCE:
             self.warn(
                 "008",
                 f"Invalid cataloging source '{cataloging_source}' at position 39.",
@@ -871,12 +1293,15 @@ class MarcLint:
                 has_sub_6 = True
             flat.append(str(code))
             flat.append(str(data))
+        # Codes present, so each punctuation rule below is a set lookup
+        # rather than another get_subfields scan of the field
+        codes = set(flat[0::2])
 
         # Final punctuation check looks at the last data element
         last_data = flat[-1] if flat else ""
-        if isinstance(last_data, str) and not re.search(r"[.?!]$", last_data):
+        if isinstance(last_data, str) and not _245_FINAL_RE.search(last_data):
             self.warn("245", "Must end with . (period).", position=pos)
-        elif isinstance(last_data, str) and re.search(r"[?!]$", last_data):
+        elif isinstance(last_data, str) and _245_FINAL_QE_RE.search(last_data):
             self.warn(
                 "245",
                 "MARC21 allows ? or ! as final punctuation but LCRI 1.0C, Nov. 2003 (LCPS 1.7.1 for RDA records), requires period.",
@@ -907,16 +1332,16 @@ class MarcLint:
                     position=pos,
                 )
 
-        if field.get_subfields("c"):
+        if "c" in codes:
             for i in range(2, len(flat), 2):
                 if flat[i] == "c":
-                    if not re.search(r"\s/$", flat[i - 1]):
+                    if not _245_BEFORE_C_RE.search(flat[i - 1]):
                         self.warn(
                             "245", "Subfield _c must be preceded by /", position=pos
                         )
-                    if re.search(r"\b\w\. \b\w\.", flat[i + 1]) and not re.search(
-                        r"\[\bi\.e\. \b\w\..*\]", flat[i + 1]
-                    ):
+                    if _245_SPACED_INITIALS_RE.search(
+                        flat[i + 1]
+                    ) and not _245_IE_INITIALS_RE.search(flat[i + 1]):
                         self.warn(
                             "245",
                             "Subfield _c initials should not have a space.",
@@ -924,53 +1349,53 @@ class MarcLint:
                         )
                     break
 
-        if field.get_subfields("b"):
+        if "b" in codes:
             for i in range(2, len(flat), 2):
-                if flat[i] == "b" and not re.search(r" [:;=]$", flat[i - 1]):
+                if flat[i] == "b" and not _245_BEFORE_B_RE.search(flat[i - 1]):
                     self.warn(
                         "245",
                         "Subfield _b should be preceded by space-colon, space-semicolon, or space-equals sign.",
                         position=pos,
                     )
 
-        if field.get_subfields("h"):
+        if "h" in codes:
             for i in range(2, len(flat), 2):
                 if flat[i] == "h":
-                    if not re.search(r"(\S$)|(\-\- $)", flat[i - 1]):
+                    if not _245_BEFORE_H_RE.search(flat[i - 1]):
                         self.warn(
                             "245",
                             "Subfield _h should not be preceded by space.",
                             position=pos,
                         )
-                    if not re.match(r"^\[\w*\s*\w*\]", flat[i + 1]):
+                    if not _245_H_BRACKETS_RE.match(flat[i + 1]):
                         self.warn(
                             "245",
                             f"Subfield _h must have matching square brackets, {flat[i]}.",
                             position=pos,
                         )
 
-        if field.get_subfields("n"):
+        if "n" in codes:
             for i in range(2, len(flat), 2):
-                if flat[i] == "n" and not re.search(r"(\S\.$)|(\-\- \.$)", flat[i - 1]):
+                if flat[i] == "n" and not _245_PERIOD_BEFORE_RE.search(flat[i - 1]):
                     self.warn(
                         "245",
                         "Subfield _n must be preceded by . (period).",
                         position=pos,
                     )
 
-        if field.get_subfields("p"):
+        if "p" in codes:
             for i in range(2, len(flat), 2):
                 if flat[i] == "p":
-                    if flat[i - 2] == "n" and not re.search(
-                        r"(\S,$)|(\-\- ,$)", flat[i - 1]
+                    if flat[i - 2] == "n" and not _245_COMMA_BEFORE_RE.search(
+                        flat[i - 1]
                     ):
                         self.warn(
                             "245",
                             "Subfield _p must be preceded by , (comma) when it follows subfield _n.",
                             position=pos,
                         )
-                    elif flat[i - 2] != "n" and not re.search(
-                        r"(\S\.$)|(\-\- \.$)", flat[i - 1]
+                    elif flat[i - 2] != "n" and not _245_PERIOD_BEFORE_RE.search(
+                        flat[i - 1]
                     ):
                         self.warn(
                             "245",
@@ -998,10 +1423,16 @@ class MarcLint:
         """Get the language code from the current record's 008 field.
 
         Returns the 3-character language code from positions 35-37 of the 008
-        field, or None if not available or invalid.
+        field, or None if not available or invalid. The value is read once per
+        record and reused by every title field's article check.
         """
+        if self._current_language is _NOT_READ:
+            self._current_language = self._read_record_language()
+        return self._current_language  # type: ignore[return-value]
 
-        fields_008 = self._current_record.get_fields("008")
+    def _read_record_language(self) -> Optional[str]:
+        """Read the language code for `_get_record_language` from the 008."""
+        fields_008 = self._current_fields_by_tag.get("008")
         if not fields_008:
             return None
 
@@ -1016,7 +1447,7 @@ class MarcLint:
             return None
 
         # Validate against known language codes
-        if LANGUAGE_CODES.get(language) or OBSOLETE_LANGUAGE_CODES.get(language):
+        if language in LANGUAGE_CODES or language in OBSOLETE_LANGUAGE_CODES:
             return language
 
         return None
@@ -1087,7 +1518,7 @@ class MarcLint:
             first_or_second = "2nd"
 
         # Indicator must be numeric (0-9)
-        if not re.match(r"^[0-9]$", ind):
+        if not _NONFILING_INDICATOR_RE.match(ind):
             self.warn(tagno, "Non-filing indicator is non-numeric", position=pos)
 
         # Extract title from subfield $a
@@ -1103,7 +1534,7 @@ class MarcLint:
 
         # Extract first word and following separator/text
         # Pattern matches: word + optional separator + rest of string
-        m = re.match(r"^([^ \(\)\[\]'\"\-]+)([ \(\)\[\]'\"])?(.*)", title, re.I)
+        m = _TITLE_FIRST_WORD_RE.match(title)
         if m:
             firstword, separator, etc = m.group(1), m.group(2) or "", m.group(3) or ""
         else:
@@ -1114,9 +1545,7 @@ class MarcLint:
         nonfilingchars = len(firstword) + char1_notalphanum + 1
 
         # Check if title starts with an exception phrase (case-insensitive)
-        isan_exception = any(
-            re.match(rf"^{re.escape(k)}", title, re.I) for k in ARTICLE_EXCEPTIONS
-        )
+        isan_exception = _ARTICLE_EXCEPTION_RE.match(title) is not None
 
         # Check if first word is an article (and not an exception)
         fw_lower = firstword.lower()
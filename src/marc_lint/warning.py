@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class MarcWarning:
     """A structured warning for a MARC record validation error.
 
@@ -34,21 +34,16 @@ class MarcWarning:
         - "245[2]: Error message" for repeating field errors (position shown)
         - "Record 12345: 245: Error message" when record_id is present
         """
-        parts = [self.field]
-
-        if self.position is not None:
-            parts[0] = f"{self.field}[{self.position + 1}]"
-
-        result = f"{parts[0]}: "
+        position = self.position
+        head = self.field if position is None else f"{self.field}[{position + 1}]"
 
         if self.subfield:
-            result += f"Subfield {self.subfield} "
-
-        result += self.message
+            result = f"{head}: Subfield {self.subfield} {self.message}"
+        else:
+            result = f"{head}: {self.message}"
 
         if self.record_id:
-            result = f"Record {self.record_id}: {result}"
-
+            return f"Record {self.record_id}: {result}"
         return result
 
     def to_dict(self) -> dict:
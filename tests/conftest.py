@@ -1,15 +1,72 @@
+import re
+from collections.abc import Callable, Iterable
+
 from pytest import fixture
 from pymarc import Record, Field, Subfield
 
 from marc_lint.linter import MarcLint
+from marc_lint.warning import MarcWarning
+
+
+@fixture(scope="session")
+def _shared_linter() -> MarcLint:
+    """Single MarcLint for the session; building the rule table is not free."""
+    return MarcLint()
 
 
 @fixture
-def linter():
-    """Fresh MarcLint instance for each test."""
+def linter(_shared_linter: MarcLint) -> MarcLint:
+    """Shared MarcLint instance with warnings cleared before each test."""
+    _shared_linter.clear_warnings()
+    return _shared_linter
+
+
+@fixture(scope="session")
+def _case_linter() -> MarcLint:
+    """Private MarcLint for `case_warnings`, never handed to tests."""
     return MarcLint()
 
 
+@fixture(scope="module")
+def case_warnings(_case_linter: MarcLint) -> Callable[[str, Record], tuple[str, ...]]:
+    """Lint each named case record once per test module and reuse its warnings.
+
+    Results are cached by case name, so a name must always refer to the same
+    record within a module, and case records must not be mutated.
+    """
+    cache: dict[str, tuple[str, ...]] = {}
+
+    def _warnings(name: str, record: Record) -> tuple[str, ...]:
+        if name not in cache:
+            _case_linter.check_record(record)
+            cache[name] = tuple(_case_linter.warnings())
+        return cache[name]
+
+    return _warnings
+
+
+def _build_minimal_skeleton(with_245: bool = True) -> Record:
+    """Build the leader/001/008/245 skeleton used by `create_minimal_record`.
+
+    The default 245 is left out when `with_245` is false.
+    """
+    rec = Record()
+    rec.leader = "00000nam a2200000 i 4500"
+    rec.add_field(
+        Field(tag="001", data="test001"),
+        Field(tag="008", data="240101s2024    xxu           000 0 eng d"),
+    )
+    if with_245:
+        rec.add_field(
+            Field(
+                tag="245",
+                indicators=["0", "0"],
+                subfields=[Subfield("a", "Test title.")],
+            )
+        )
+    return rec
+
+
 def create_minimal_record(fields: list[Field] | None = None) -> Record:
     """Create a minimal valid MARC record with required fields.
 
@@ -25,23 +82,37 @@ def create_minimal_record(fields: list[Field] | None = None) -> Record:
     Returns:
         A pymarc.Record with the minimal required fields
     """
-    rec = Record()
-    rec.leader = "00000nam a2200000 i 4500"
-    rec.add_field(Field(tag="001", data="test001"))
-    rec.add_field(Field(tag="008", data="240101s2024    xxu           000 0 eng d"))
-    rec.add_field(
-        Field(
-            tag="245",
-            indicators=["0", "0"],
-            subfields=[Subfield("a", "Test title.")],
-        )
-    )
-    if fields:
-        for f in fields:
-            # Skip 245 if already added and user provides their own
-            if f.tag == "245":
-                # Remove the default 245 and add the user's
-                for existing in rec.get_fields("245"):
-                    rec.remove_field(existing)
-            rec.add_field(f)
+    # Building the four objects directly is an order of magnitude cheaper than
+    # deep-copying a cached template, and callers never share state.
+    if not fields:
+        return _build_minimal_skeleton()
+    # Leave out the default 245 when the caller supplies their own
+    rec = _build_minimal_skeleton(with_245=not any(f.tag == "245" for f in fields))
+    rec.add_field(*fields)
     return rec
+
+
+def field_warnings(linter: MarcLint, tag: str) -> list[MarcWarning]:
+    """Return the structured warnings raised against `tag` by the last check."""
+    return [w for w in linter.warnings_structured() if w.field == tag]
+
+
+def field_messages(linter: MarcLint, tag: str) -> tuple[str, ...]:
+    """Return the lowercased messages of `tag` warnings from the last check."""
+    return tuple(w.message.lower() for w in field_warnings(linter, tag))
+
+
+_RECORD_PREFIX_RE = re.compile(r"^Record [^:]*: ")
+
+
+def strip_record_prefix(warning: str) -> str:
+    """Drop the leading "Record <id>: " from a formatted warning."""
+    return _RECORD_PREFIX_RE.sub("", warning, count=1)
+
+
+def has_warning(warnings: Iterable[str], text: str) -> bool:
+    """Return True if any formatted warning contains `text`.
+
+    Scans the warnings in place instead of joining them into one string.
+    """
+    return any(text in w for w in warnings)
@@ -3,6 +3,8 @@
 from pytest import fixture
 from pymarc import Record, Field, Subfield
 
+from tests.conftest import field_messages, field_warnings
+
 
 @fixture
 def make_record():
@@ -33,14 +35,14 @@ class TestField008Validation:
         # Standard valid 008
         record = make_record("240101s2024    xxu           000 0 eng d")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
+        field_008_warnings = field_warnings(linter, "008")
         assert len(field_008_warnings) == 0
 
     def test_short_008(self, linter, make_record):
         """008 field shorter than 40 characters should warn."""
         record = make_record("240101s2024")  # Too short
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
+        field_008_warnings = field_warnings(linter, "008")
         assert len(field_008_warnings) >= 1
         assert any("40 characters" in w.message for w in field_008_warnings)
 
@@ -49,8 +51,8 @@ class TestField008Validation:
         # 'x' is not a valid type of date
         record = make_record("240101x2024    xxu           000 0 eng d")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
-        assert any("type of date" in w.message.lower() for w in field_008_warnings)
+        messages = field_messages(linter, "008")
+        assert any("type of date" in m for m in messages)
 
     def test_valid_types_of_date(self, linter, make_record):
         """All valid type of date values should pass."""
@@ -75,10 +77,8 @@ class TestField008Validation:
             data = f"240101{date_type}2024    xxu           000 0 eng d"
             record = make_record(data)
             linter.check_record(record)
-            field_008_warnings = [w for w in linter._warnings if w.field == "008"]
-            type_warnings = [
-                w for w in field_008_warnings if "type of date" in w.message.lower()
-            ]
+            messages = field_messages(linter, "008")
+            type_warnings = [m for m in messages if "type of date" in m]
             assert len(type_warnings) == 0, f"Date type '{date_type}' should be valid"
 
     def test_invalid_date1(self, linter, make_record):
@@ -86,7 +86,7 @@ class TestField008Validation:
         # 'abcd' is not a valid date
         record = make_record("240101sabcd    xxu           000 0 eng d")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
+        field_008_warnings = field_warnings(linter, "008")
         assert any("Date 1" in w.message for w in field_008_warnings)
 
     def test_valid_date_formats(self, linter, make_record):
@@ -97,7 +97,7 @@ class TestField008Validation:
             data = f"240101s{date}    xxu           000 0 eng d"
             record = make_record(data)
             linter.check_record(record)
-            field_008_warnings = [w for w in linter._warnings if w.field == "008"]
+            field_008_warnings = field_warnings(linter, "008")
             date_warnings = [w for w in field_008_warnings if "Date 1" in w.message]
             assert len(date_warnings) == 0, f"Date '{date}' should be valid"
 
@@ -106,17 +106,15 @@ class TestField008Validation:
         # 'zzz' is not a valid country code
         record = make_record("240101s2024    zzz           000 0 eng d")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
-        assert any("country code" in w.message.lower() for w in field_008_warnings)
+        messages = field_messages(linter, "008")
+        assert any("country code" in m for m in messages)
 
     def test_valid_country_code(self, linter, make_record):
         """Valid country code should pass."""
         record = make_record("240101s2024    nyu           000 0 eng d")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
-        country_warnings = [
-            w for w in field_008_warnings if "country code" in w.message.lower()
-        ]
+        messages = field_messages(linter, "008")
+        country_warnings = [m for m in messages if "country code" in m]
         assert len(country_warnings) == 0
 
     def test_obsolete_country_code(self, linter, make_record):
@@ -124,12 +122,8 @@ class TestField008Validation:
         # 'cs ' is obsolete (Czechoslovakia)
         record = make_record("240101s2024    cs            000 0 eng d")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
-        obsolete_warnings = [
-            w
-            for w in field_008_warnings
-            if "obsolete" in w.message.lower() and "country" in w.message.lower()
-        ]
+        messages = field_messages(linter, "008")
+        obsolete_warnings = [m for m in messages if "obsolete" in m and "country" in m]
         assert len(obsolete_warnings) == 1
 
     def test_invalid_language_code(self, linter, make_record):
@@ -137,17 +131,15 @@ class TestField008Validation:
         # 'zzz' is not a valid language code
         record = make_record("240101s2024    xxu           000 0 zzz d")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
-        assert any("language code" in w.message.lower() for w in field_008_warnings)
+        messages = field_messages(linter, "008")
+        assert any("language code" in m for m in messages)
 
     def test_valid_language_code(self, linter, make_record):
         """Valid language code should pass."""
         record = make_record("240101s2024    xxu           000 0 fre d")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
-        lang_warnings = [
-            w for w in field_008_warnings if "language code" in w.message.lower()
-        ]
+        messages = field_messages(linter, "008")
+        lang_warnings = [m for m in messages if "language code" in m]
         assert len(lang_warnings) == 0
 
     def test_obsolete_language_code(self, linter, make_record):
@@ -155,12 +147,8 @@ class TestField008Validation:
         # 'esk' is obsolete (Eskimo)
         record = make_record("240101s2024    xxu           000 0 esk d")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
-        obsolete_warnings = [
-            w
-            for w in field_008_warnings
-            if "obsolete" in w.message.lower() and "language" in w.message.lower()
-        ]
+        messages = field_messages(linter, "008")
+        obsolete_warnings = [m for m in messages if "obsolete" in m and "language" in m]
         assert len(obsolete_warnings) == 1
 
     def test_invalid_modified_record(self, linter, make_record):
@@ -168,27 +156,25 @@ class TestField008Validation:
         # 'z' is not valid for modified record
         record = make_record("240101s2024    xxu           000 0 engzd")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
-        assert any("modified record" in w.message.lower() for w in field_008_warnings)
+        messages = field_messages(linter, "008")
+        assert any("modified record" in m for m in messages)
 
     def test_invalid_cataloging_source(self, linter, make_record):
         """Invalid cataloging source at position 39 should warn."""
         # 'z' is not valid for cataloging source
         record = make_record("240101s2024    xxu           000 0 eng z")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
-        assert any("cataloging source" in w.message.lower() for w in field_008_warnings)
+        messages = field_messages(linter, "008")
+        assert any("cataloging source" in m for m in messages)
 
     def test_blanks_allowed(self, linter, make_record):
         """Blanks should be allowed for country/language no attempt to code."""
         # Using blanks and | for no attempt to code
         record = make_record("240101s2024    |||           000 0 ||| d")
         linter.check_record(record)
-        field_008_warnings = [w for w in linter._warnings if w.field == "008"]
+        messages = field_messages(linter, "008")
         # Should not warn about invalid country or language when using |
         country_lang_warnings = [
-            w
-            for w in field_008_warnings
-            if "country" in w.message.lower() or "language" in w.message.lower()
+            m for m in messages if "country" in m or "language" in m
         ]
         assert len(country_lang_warnings) == 0
@@ -13,10 +13,16 @@ from pymarc import Record, Field, Subfield
 
 from tests.conftest import create_minimal_record
 
+# pymarc copies indicators into its own Indicators tuple, so one is shared
+BLANK_INDICATORS = (" ", " ")
 
-@fixture
+
+@fixture(scope="session")
 def cases():
-    """Generate synthetic MARC records with various 020 scenarios."""
+    """Generate synthetic MARC records with various 020 scenarios.
+
+    Built once per session: `check_record` only reads the records.
+    """
 
     def create_record(fields: list[Field]) -> Record:
         """Helper to build a Record from a list of fields."""
@@ -27,7 +33,7 @@ def cases():
     # Case 1: Valid ISBN-10
     f1 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "0123456789"),
         ],
@@ -37,7 +43,7 @@ def cases():
     # Case 2: Valid ISBN-10 with X checksum
     f2 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "155404295X"),
         ],
@@ -47,7 +53,7 @@ def cases():
     # Case 3: Valid ISBN-13
     f3 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "9780123456786"),
         ],
@@ -57,7 +63,7 @@ def cases():
     # Case 4: Valid ISBN-10 with hyphens
     f4 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "0-12-345678-9"),
         ],
@@ -67,7 +73,7 @@ def cases():
     # Case 5: Valid ISBN-10 with qualifier (proper spacing)
     f5 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "0123456789 (hardcover)"),
         ],
@@ -77,7 +83,7 @@ def cases():
     # Case 6: ISBN-10 with bad checksum
     f6 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "0123456788"),  # Should be 9
         ],
@@ -87,7 +93,7 @@ def cases():
     # Case 7: ISBN-13 with bad checksum
     f7 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "9780123456787"),  # Should be 6
         ],
@@ -97,7 +103,7 @@ def cases():
     # Case 8: ISBN with wrong number of digits
     f8 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "012345678"),  # Only 9 digits
         ],
@@ -107,7 +113,7 @@ def cases():
     # Case 9: ISBN with qualifier but no space before parenthesis
     f9 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "0123456789(hardcover)"),  # Missing space
         ],
@@ -117,7 +123,7 @@ def cases():
     # Case 10: ISBN with invalid characters
     f10 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "ISBN 0123456789"),  # Should not start with "ISBN"
         ],
@@ -128,7 +134,7 @@ def cases():
     # Note: must be hyphenated or start with "ISBN" to trigger check
     f11 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("z", "0-12-345678-9"),
         ],
@@ -138,7 +144,7 @@ def cases():
     # Case 12: Invalid ISBN in $z (should not warn about validity)
     f12 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("z", "0123456788"),  # Bad checksum
         ],
@@ -148,7 +154,7 @@ def cases():
     # Case 13: ISBN in $z with "ISBN" prefix
     f13 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("z", "ISBN 0123456789"),
         ],
@@ -158,7 +164,7 @@ def cases():
     # Case 14: ISBN in $z with hyphenated format
     f14 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("z", "0-12-345678-9"),
         ],
@@ -168,7 +174,7 @@ def cases():
     # Case 15: Multiple ISBNs (both $a and $z)
     f15 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "0123456789 (hardcover)"),
             Subfield("z", "9876543210"),  # Bad checksum
@@ -179,7 +185,7 @@ def cases():
     # Case 16: ISBN-13 with qualifier
     f16 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "9780123456786 (paperback)"),
         ],
@@ -189,7 +195,7 @@ def cases():
     # Case 17: ISBN with multiple qualifiers
     f17 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "0123456789 (v. 1 : hardcover)"),
         ],
@@ -199,7 +205,7 @@ def cases():
     # Case 18: ISBN-10 with X not at end
     f18 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "X123456789"),  # X should only be at end
         ],
@@ -209,7 +215,7 @@ def cases():
     # Case 19: Valid ISBN with price
     f19 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", "0123456789"),
             Subfield("c", "$29.95"),
@@ -220,7 +226,7 @@ def cases():
     # Case 20: Empty $a subfield
     f20 = Field(
         tag="020",
-        indicators=[" ", " "],
+        indicators=BLANK_INDICATORS,
         subfields=[
             Subfield("a", ""),
         ],
@@ -1,8 +1,19 @@
 """Tests for MARC leader validation."""
 
-from pytest import fixture
+from pytest import fixture, mark, param
 from pymarc import Record, Field, Subfield
 
+from tests.conftest import field_warnings
+
+# Leaders for every valid record status (05) and type of record (06)
+_STATUS_LEADERS = tuple(
+    param(f"00000{status}am a2200000 i 4500", id=status) for status in "acdnp"
+)
+_TYPE_LEADERS = tuple(
+    param(f"00000n{rec_type}m a2200000 i 4500", id=rec_type)
+    for rec_type in "acdefgijkmoprt"
+)
+
 
 @fixture
 def make_record():
@@ -38,14 +49,14 @@ class TestLeaderValidation:
         """Valid leader should produce no warnings."""
         record = make_record(leader="00000nam a2200000 i 4500")
         linter.check_record(record)
-        leader_warnings = [w for w in linter._warnings if w.field == "LDR"]
+        leader_warnings = field_warnings(linter, "LDR")
         assert len(leader_warnings) == 0
 
     def test_short_leader(self, linter, make_record):
         """Leader shorter than 24 characters should warn."""
         record = make_record(leader="00000nam a22", include_required=False)
         linter.check_record(record)
-        leader_warnings = [w for w in linter._warnings if w.field == "LDR"]
+        leader_warnings = field_warnings(linter, "LDR")
         assert len(leader_warnings) == 1
         assert "must be 24 characters" in leader_warnings[0].message
 
@@ -54,7 +65,7 @@ class TestLeaderValidation:
         # Position 05 is 'x' which is invalid
         record = make_record(leader="00000xam a2200000 i 4500")
         linter.check_record(record)
-        leader_warnings = [w for w in linter._warnings if w.field == "LDR"]
+        leader_warnings = field_warnings(linter, "LDR")
         assert any("record status" in w.message.lower() for w in leader_warnings)
 
     def test_invalid_type_of_record(self, linter, make_record):
@@ -62,7 +73,7 @@ class TestLeaderValidation:
         # Position 06 is 'x' which is invalid
         record = make_record(leader="00000nxm a2200000 i 4500")
         linter.check_record(record)
-        leader_warnings = [w for w in linter._warnings if w.field == "LDR"]
+        leader_warnings = field_warnings(linter, "LDR")
         assert any("type of record" in w.message.lower() for w in leader_warnings)
 
     def test_invalid_bibliographic_level(self, linter, make_record):
@@ -70,7 +81,7 @@ class TestLeaderValidation:
         # Position 07 is 'x' which is invalid
         record = make_record(leader="00000nax a2200000 i 4500")
         linter.check_record(record)
-        leader_warnings = [w for w in linter._warnings if w.field == "LDR"]
+        leader_warnings = field_warnings(linter, "LDR")
         assert any("bibliographic level" in w.message.lower() for w in leader_warnings)
 
     def test_invalid_type_of_control(self, linter, make_record):
@@ -78,7 +89,7 @@ class TestLeaderValidation:
         # Position 08 is 'x' which is invalid
         record = make_record(leader="00000namxa2200000 i 4500")
         linter.check_record(record)
-        leader_warnings = [w for w in linter._warnings if w.field == "LDR"]
+        leader_warnings = field_warnings(linter, "LDR")
         assert any("type of control" in w.message.lower() for w in leader_warnings)
 
     def test_invalid_encoding_level(self, linter, make_record):
@@ -86,46 +97,19 @@ class TestLeaderValidation:
         # Position 17 is 'x' which is invalid
         record = make_record(leader="00000nam a2200000xi 4500")
         linter.check_record(record)
-        leader_warnings = [w for w in linter._warnings if w.field == "LDR"]
+        leader_warnings = field_warnings(linter, "LDR")
         assert any("encoding level" in w.message.lower() for w in leader_warnings)
 
-    def test_valid_record_statuses(self, linter, make_record):
-        """All valid record status values should pass."""
-        valid_statuses = ["a", "c", "d", "n", "p"]
-        for status in valid_statuses:
-            leader = f"00000{status}am a2200000 i 4500"
-            record = make_record(leader=leader)
-            linter.check_record(record)
-            leader_warnings = [w for w in linter._warnings if w.field == "LDR"]
-            status_warnings = [
-                w for w in leader_warnings if "record status" in w.message.lower()
-            ]
-            assert len(status_warnings) == 0, f"Status '{status}' should be valid"
-
-    def test_valid_types_of_record(self, linter, make_record):
-        """All valid type of record values should pass."""
-        valid_types = [
-            "a",
-            "c",
-            "d",
-            "e",
-            "f",
-            "g",
-            "i",
-            "j",
-            "k",
-            "m",
-            "o",
-            "p",
-            "r",
-            "t",
-        ]
-        for rec_type in valid_types:
-            leader = f"00000n{rec_type}m a2200000 i 4500"
-            record = make_record(leader=leader)
-            linter.check_record(record)
-            leader_warnings = [w for w in linter._warnings if w.field == "LDR"]
-            type_warnings = [
-                w for w in leader_warnings if "type of record" in w.message.lower()
-            ]
-            assert len(type_warnings) == 0, f"Type '{rec_type}' should be valid"
+    @mark.parametrize("leader", _STATUS_LEADERS)
+    def test_valid_record_status(self, linter, make_record, leader):
+        """Each valid record status value should pass."""
+        linter.check_record(make_record(leader=leader))
+        leader_warnings = field_warnings(linter, "LDR")
+        assert not any("record status" in w.message.lower() for w in leader_warnings)
+
+    @mark.parametrize("leader", _TYPE_LEADERS)
+    def test_valid_type_of_record(self, linter, make_record, leader):
+        """Each valid type of record value should pass."""
+        linter.check_record(make_record(leader=leader))
+        leader_warnings = field_warnings(linter, "LDR")
+        assert not any("type of record" in w.message.lower() for w in leader_warnings)
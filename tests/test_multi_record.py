@@ -1,9 +1,11 @@
 """Tests for multi-record processing and record identification."""
 
-from pytest import fixture
+from multiprocessing import Pool
+
+from pytest import fixture, raises
 from pymarc import Record, Field, Subfield
 
-from marc_lint import RecordResult
+from marc_lint import MarcLint, MarcWarning, RecordResult
 
 
 @fixture
@@ -35,13 +37,22 @@ def make_record():
     return _make
 
 
+class _LabelledLinter(MarcLint):
+    """Subclass whose constructor needs an argument (module level to pickle)."""
+
+    def __init__(self, label: str, cache_size: int = 0) -> None:
+        super().__init__(cache_size=cache_size)
+        self.label = label
+
+    def check_245(self, field, position=0):
+        self.warn("245", f"Seen by {self.label}.", position=position or None)
+
+
 class TestRecordResult:
     """Tests for RecordResult class."""
 
     def test_record_result_creation(self):
         """RecordResult should store record ID and warnings."""
-        from marc_lint.warning import MarcWarning
-
         warnings = [MarcWarning(field="245", message="Test error")]
         result = RecordResult(record_id="12345", warnings=warnings)
 
@@ -56,16 +67,17 @@ class TestRecordResult:
 
     def test_record_result_is_not_valid(self):
         """is_valid should return False when warnings exist."""
-        from marc_lint.warning import MarcWarning
-
         warnings = [MarcWarning(field="245", message="Test error")]
         result = RecordResult(record_id="12345", warnings=warnings)
         assert result.is_valid is False
 
+    def test_record_result_has_no_instance_dict(self):
+        """RecordResult should use slots rather than a per-instance __dict__."""
+        result = RecordResult("12345", [])
+        assert not hasattr(result, "__dict__")
+
     def test_record_result_repr(self):
         """RecordResult repr should be informative."""
-        from marc_lint.warning import MarcWarning
-
         warnings = [MarcWarning(field="245", message="Test error")]
         result = RecordResult(record_id="12345", warnings=warnings)
         repr_str = repr(result)
@@ -115,6 +127,41 @@ class TestCheckRecords:
         assert results[1].record_id == "bad001"
         assert any("245" in w.field for w in results[1].warnings)
 
+    def test_check_records_fail_fast(self, linter, make_record):
+        """fail_fast should keep is_valid exact but stop at the first warning."""
+        records = [
+            make_record(control_number="good001"),
+            make_record(has_error=True),  # no 001 and no final period
+        ]
+        full = linter.check_records(records)
+        results = linter.check_records(records, fail_fast=True)
+
+        assert [r.is_valid for r in results] == [True, False]
+        assert len(full[1].warnings) > 1
+        assert results[1].warnings == full[1].warnings[:1]
+
+    def test_fail_fast_not_swallowed_by_checker(self, make_record):
+        """A checker's broad `except Exception` must not swallow fail-fast."""
+
+        class GuardedLinter(MarcLint):
+            def check_245(self, field, position=0):
+                try:
+                    super().check_245(field, position)
+                except Exception:
+                    self.warn("245", "Checker failed.")
+
+        record = make_record(control_number="bad001", has_error=True)
+        linter = GuardedLinter()
+        full = linter.check_record(record)
+
+        assert linter.check_record(record, fail_fast=True) == full[:1]
+
+    def test_is_valid_record(self, linter, make_record):
+        """is_valid_record should agree with a full check."""
+        assert linter.is_valid_record(make_record(control_number="good001"))
+        assert not linter.is_valid_record(make_record(has_error=True))
+        assert len(linter.warnings_structured()) == 1
+
     def test_check_records_without_001(self, linter, make_record):
         """Records without 001 should use index as ID when specified."""
         records = [
@@ -127,6 +174,19 @@ class TestCheckRecords:
         assert results[0].record_id == "0"
         assert results[1].record_id == "1"
 
+    def test_check_records_001_without_data(self, linter, make_record):
+        """A data field tagged 001 has no control number, even with the index."""
+        record = make_record(has_error=True)
+        record.add_field(
+            Field(tag="001", indicators=[" ", " "], subfields=[Subfield("a", "x")])
+        )
+
+        for use_index_as_id in (False, True):
+            result = linter.check_records([record], use_index_as_id=use_index_as_id)[0]
+            assert result.record_id == "0"
+            assert result.warnings
+            assert all(w.record_id is None for w in result.warnings)
+
     def test_check_records_mixed_with_without_001(self, linter, make_record):
         """Mix of records with and without 001 fields."""
         records = [
@@ -147,11 +207,89 @@ class TestCheckRecords:
 
         assert results[0].record is record
 
+    def test_check_records_without_record_reference(self, linter, make_record):
+        """retain_record=False should drop the Record but keep ID and warnings."""
+        record = make_record(control_number="test001", has_error=True)
+        results = linter.check_records([record], retain_record=False)
+
+        assert results[0].record is None
+        assert results[0].record_id == "test001"
+        assert not results[0].is_valid
+
     def test_check_records_empty_list(self, linter):
         """Empty list should return empty results."""
         results = linter.check_records([])
         assert len(results) == 0
 
+    def test_check_records_accepts_str_subclass_tags(self, linter, make_record):
+        """Tags that are str subclasses should be reported like plain tags."""
+
+        class Tag(str):
+            pass
+
+        record = make_record(control_number="rec")
+        record.add_field(Field(tag=Tag("001"), data="dup"))
+
+        results = linter.check_records([record])
+
+        assert [w.field for w in results[0].warnings] == ["001"]
+
+    def test_iter_check_records_is_lazy(self, linter, make_record):
+        """iter_check_records should only pull records as results are consumed."""
+        pulled = []
+
+        def stream():
+            for i in range(3):
+                pulled.append(i)
+                yield make_record(control_number=f"rec{i}")
+
+        results = linter.iter_check_records(stream())
+        assert pulled == []
+
+        first = next(results)
+        assert first.record_id == "rec0"
+        assert pulled == [0]
+        assert [r.record_id for r in results] == ["rec1", "rec2"]
+
+    def test_check_records_parallel_matches_sequential(self, linter, make_record):
+        """Sharding across processes should keep order, IDs and warnings."""
+        records = [
+            make_record(
+                control_number=f"rec{i}" if i % 3 else None, has_error=i % 2 == 0
+            )
+            for i in range(300)
+        ]
+        expected = [
+            (r.record_id, r.warnings)
+            for r in linter.check_records(records, use_index_as_id=True)
+        ]
+
+        results = linter.check_records(records, use_index_as_id=True, processes=2)
+
+        assert [(r.record_id, r.warnings) for r in results] == expected
+        assert all(r.record is rec for r, rec in zip(results, records))
+
+    def test_check_records_parallel_keeps_linter_config(self, make_record):
+        """Workers should check with the caller's constructor arguments."""
+        linter = _LabelledLinter("qa", cache_size=8)
+        records = [make_record(control_number=f"rec{i % 4}") for i in range(300)]
+
+        results = linter.check_records(records, processes=2)
+
+        assert len(results) == 300
+        assert all([w.message for w in r.warnings] == ["Seen by qa."] for r in results)
+
+    def test_check_records_parallel_reuses_given_pool(self, linter, make_record):
+        """A caller-supplied pool should be used and left open."""
+        records = [make_record(control_number=f"rec{i}") for i in range(300)]
+
+        with Pool(2) as pool:
+            first = linter.check_records(records, processes=2, pool=pool)
+            second = linter.check_records(records, processes=2, pool=pool)
+
+        assert [r.record_id for r in first] == [f"rec{i}" for i in range(300)]
+        assert [r.warnings for r in second] == [r.warnings for r in first]
+
 
 class TestWarningRecordId:
     """Tests for record_id in MarcWarning."""
@@ -168,8 +306,6 @@ class TestWarningRecordId:
 
     def test_warning_str_with_record_id(self):
         """Warning string should include record ID."""
-        from marc_lint.warning import MarcWarning
-
         warning = MarcWarning(
             field="245",
             message="Must end with . (period).",
@@ -181,8 +317,6 @@ class TestWarningRecordId:
 
     def test_warning_to_dict_includes_record_id(self):
         """to_dict should include record_id."""
-        from marc_lint.warning import MarcWarning
-
         warning = MarcWarning(
             field="245",
             message="Test error",
@@ -209,3 +343,114 @@ class TestWarningRecordId:
         assert isinstance(warnings, list)
         assert len(warnings) > 0
         assert all(hasattr(w, "field") for w in warnings)
+
+    def test_warnings_strings_follow_latest_check(self, linter, make_record):
+        """warnings() should reflect the most recent check_record call."""
+        linter.check_record(make_record(control_number="bad001", has_error=True))
+        first = linter.warnings()
+        assert first and first == linter.warnings()
+
+        linter.check_record(make_record(control_number="good001"))
+        assert linter.warnings() == []
+
+    def test_warnings_strings_follow_edited_warnings(self, linter, make_record):
+        """warnings() should reflect edits made through the returned list."""
+        warnings = linter.check_record(make_record(has_error=True))
+        count = len(linter.warnings())
+
+        warnings[0].message = "Edited."
+        warnings.append(MarcWarning(field="999", message="Added."))
+
+        strings = linter.warnings()
+        assert len(strings) == count + 1
+        assert strings[0].endswith("Edited.")
+        assert strings[-1] == "999: Added."
+
+    def test_subclass_checkers_dispatch_per_record(self, make_record):
+        """Tag checkers defined on a subclass should run for every record."""
+
+        class TitleCounter(MarcLint):
+            def check_245(self, field, position=0):
+                self.warn("245", "Seen.", position=position or None)
+
+        linter = TitleCounter()
+        for control_number in ("rec001", "rec002"):
+            warnings = linter.check_record(make_record(control_number=control_number))
+            assert [w.message for w in warnings] == ["Seen."]
+
+    def test_reassigned_checker_used_for_next_record(self, make_record):
+        """Replacing a checker on an instance should apply from the next record."""
+        linter = MarcLint()
+        record = make_record(control_number="rec001")
+        assert linter.check_record(record) == []
+
+        linter.check_245 = lambda field, position=0: linter.warn("245", "Patched.")
+
+        assert [w.message for w in linter.check_record(record)] == ["Patched."]
+
+    def test_shared_field_rules_are_read_only(self, make_record):
+        """One linter must not be able to edit the rules another one uses."""
+        linter = MarcLint()
+
+        with raises(TypeError):
+            linter._rules["245"]["repeatable"] = True
+        with raises(TypeError):
+            linter._rules["245"]["subfields"]["a"] = {}
+
+        record = make_record(control_number="rec001")
+        record.add_field(Field(tag="245", indicators=["0", "0"], subfields=[]))
+        assert "Field is not repeatable." in [
+            w.message for w in MarcLint().check_record(record)
+        ]
+
+
+class TestDuplicateRecordCache:
+    """Tests for the opt-in duplicate-record cache."""
+
+    def test_cache_disabled_by_default(self, make_record):
+        """A default linter should not cache anything."""
+        linter = MarcLint()
+        linter.check_record(make_record(control_number="rec001"))
+        assert linter.cache_stats() == {
+            "hits": 0,
+            "misses": 0,
+            "size": 0,
+            "maxsize": 0,
+        }
+
+    def test_duplicate_records_hit_cache(self, linter, make_record):
+        """Identical records should be checked once and give equal warnings."""
+        cached = MarcLint(cache_size=8)
+        records = [make_record(control_number="dup001", has_error=True)] * 2
+        records.append(make_record(control_number="dup001", has_error=True))
+
+        results = cached.check_records(records)
+
+        expected = linter.check_records(records)
+        assert [r.warnings for r in results] == [r.warnings for r in expected]
+        assert results[0].warnings[0] is not results[1].warnings[0]
+        assert cached.cache_stats()["hits"] == 2
+        assert cached.cache_stats()["misses"] == 1
+
+    def test_cache_keys_on_content_and_record_id(self, make_record):
+        """Different content or an explicit record_id should miss the cache."""
+        cached = MarcLint(cache_size=8)
+        record = make_record(control_number="rec001", has_error=True)
+
+        cached.check_record(record)
+        cached.check_record(make_record(control_number="rec002", has_error=True))
+        warnings = cached.check_record(record, record_id="explicit")
+
+        assert all(w.record_id == "explicit" for w in warnings)
+        assert cached.cache_stats()["misses"] == 3
+
+    def test_cache_evicts_least_recently_used(self, make_record):
+        """The cache should hold at most cache_size records."""
+        cached = MarcLint(cache_size=1)
+        first = make_record(control_number="rec001")
+        cached.check_record(first)
+        cached.check_record(make_record(control_number="rec002"))
+        cached.check_record(first)
+
+        assert cached.cache_stats()["size"] == 1
+        assert cached.cache_stats()["hits"] == 0
@@ -257,6 +257,13 @@ def test_warning_dataclass_immutability():
     assert warning.message == "modified"
 
 
+def test_warning_has_no_instance_dict():
+    """Test that warnings use slots rather than a per-instance __dict__."""
+    warning = MarcWarning(field="020", message="test")
+
+    assert not hasattr(warning, "__dict__")
+
+
 def test_warning_dict_keys_present():
     """Test that to_dict always includes all keys."""
     warning = MarcWarning(field="020", message="test")